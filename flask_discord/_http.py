@@ -2,6 +2,8 @@ import cachetools
 import requests
 import typing
 import json
+import time
+import threading
 import abc
 
 from . import configs
@@ -11,6 +13,11 @@ from flask import session, request
 from collections.abc import Mapping
 from requests_oauthlib import OAuth2Session
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DiscordOAuth2HttpClient(abc.ABC):
     """An OAuth2 http abstract base class providing some factory methods.
@@ -37,6 +44,9 @@ class DiscordOAuth2HttpClient(abc.ABC):
         self.users_cache = users_cache
         self.proxy = proxy
         self.proxy_auth = proxy_auth
+        self.fast_json = False
+        self.response_cache = None
+        self.response_cache_lock = threading.RLock()
 
         if app is not None:
             self.init_app(app)
@@ -55,13 +65,21 @@ class DiscordOAuth2HttpClient(abc.ABC):
         self.__client_secret = self.__client_secret or app.config["DISCORD_CLIENT_SECRET"]
         self.redirect_uri = self.redirect_uri or app.config["DISCORD_REDIRECT_URI"]
         self.__bot_token = self.__bot_token or app.config.get("DISCORD_BOT_TOKEN", str())
-        self.users_cache = cachetools.LFUCache(
+        self.users_cache = cachetools.LRUCache(
             app.config.get("DISCORD_USERS_CACHE_MAX_LIMIT", configs.DISCORD_USERS_CACHE_DEFAULT_MAX_LIMIT)
         ) if self.users_cache is None else self.users_cache
         if not issubclass(self.users_cache.__class__, Mapping):
             raise ValueError("Instance users_cache must be a mapping like object.")
         self.proxy = self.proxy or app.config.get("DISCORD_PROXY_SETTINGS")
         self.proxy_auth = self.proxy_auth or app.config.get("DISCORD_PROXY_AUTH_SETTINGS")
+        self.fast_json = app.config.get("DISCORD_FAST_JSON", False)
+        if self.fast_json and orjson is None:
+            raise ImportError("orjson must be installed to use DISCORD_FAST_JSON.")
+        response_cache_ttl = app.config.get("DISCORD_RESPONSE_CACHE_TTL", configs.DISCORD_RESPONSE_CACHE_DEFAULT_TTL)
+        self.response_cache = cachetools.TTLCache(
+            app.config.get("DISCORD_RESPONSE_CACHE_MAX_SIZE", configs.DISCORD_RESPONSE_CACHE_DEFAULT_MAX_SIZE),
+            response_cache_ttl
+        ) if response_cache_ttl else None
         app.discord = self
 
     @property
@@ -96,6 +114,19 @@ class DiscordOAuth2HttpClient(abc.ABC):
             authorization_response=request.url
         )
 
+    def _refresh_token_if_expiring(self, margin=60):
+        """Refreshes and saves the authorization token if it expires within ``margin`` seconds. Used before sending
+        concurrent requests, so that they don't each try to refresh the same single use refresh token.
+
+        """
+        token = self.get_authorization_token()
+        if not token or token.get("expires_at", float("inf")) > time.time() + margin:
+            return
+        discord = self._make_session(token=token)
+        self.save_authorization_token(discord.refresh_token(
+            configs.DISCORD_TOKEN_URL, client_id=self.client_id, client_secret=self.__client_secret
+        ))
+
     def _make_session(self, token: str = None, state: str = None, scope: list = None) -> OAuth2Session:
         """A low level method used for creating OAuth2 session.
 
@@ -128,7 +159,9 @@ class DiscordOAuth2HttpClient(abc.ABC):
             auto_refresh_url=configs.DISCORD_TOKEN_URL,
             token_updater=self.save_authorization_token)
 
-    def request(self, route: str, method="GET", data=None, oauth=True, **kwargs) -> typing.Union[dict, str]:
+    def request(
+            self, route: str, method="GET", data=None, oauth=True, token: dict = None, **kwargs
+    ) -> typing.Union[dict, str]:
         """Sends HTTP request to provided route or discord endpoint.
 
         Note
@@ -145,6 +178,9 @@ class DiscordOAuth2HttpClient(abc.ABC):
             The optional payload the include with the request.
         oauth : bool
             A boolean determining if this should be Discord OAuth2 session request or any standard request.
+        token : dict, optional
+            The authorization token to use for OAuth2 session request instead of the one returned by
+            :py:meth:`get_authorization_token`. Passing it lets the request be sent outside of a Flask context.
 
         Returns
         -------
@@ -168,6 +204,7 @@ class DiscordOAuth2HttpClient(abc.ABC):
             kwargs["proxy_auth"] = self.proxy_auth
 
         response = self._make_session(
+            token=token
         ).request(method, route, data, **kwargs) if oauth else requests.request(method, route, data=data, **kwargs)
 
         if response.status_code == 401:
@@ -176,7 +213,7 @@ class DiscordOAuth2HttpClient(abc.ABC):
             raise exceptions.RateLimited(response.json(), response.headers)
 
         try:
-            return response.json()
+            return orjson.loads(response.content) if self.fast_json else response.json()
         except json.JSONDecodeError:
             return response.text
 
@@ -30,9 +30,9 @@ class DiscordOAuth2Session(_http.DiscordOAuth2HttpClient):
         The bot token of the application. This is required when you also need to access bot scope resources
         beyond the normal resources provided by the OAuth. Can be also set to flask config with
         key ``DISCORD_BOT_TOKEN``.
-    users_cache : cachetools.LFUCache, optional
+    users_cache : cachetools.LRUCache, optional
         Any dict like mapping to internally cache the authorized users. Preferably an instance of
-        cachetools.LFUCache or cachetools.TTLCache. If not specified, default cachetools.LFUCache is used.
+        cachetools.LRUCache or cachetools.TTLCache. If not specified, default cachetools.LRUCache is used.
         Uses the default max limit for cache if ``DISCORD_USERS_CACHE_MAX_LIMIT`` isn't specified in app config.
 
     Attributes
@@ -41,10 +41,13 @@ class DiscordOAuth2Session(_http.DiscordOAuth2HttpClient):
         The client ID of discord application provided.
     redirect_uri : str
         The default URL to use to redirect user to after authorization.
-    users_cache : cachetools.LFUCache
+    users_cache : cachetools.LRUCache
         A dict like mapping to internally cache the authorized users. Preferably an instance of
-        cachetools.LFUCache or cachetools.TTLCache. If not specified, default cachetools.LFUCache is used.
+        cachetools.LRUCache or cachetools.TTLCache. If not specified, default cachetools.LRUCache is used.
         Uses the default max limit for cache if ``DISCORD_USERS_CACHE_MAX_LIMIT`` isn't specified in app config.
+    response_cache : cachetools.TTLCache
+        A short lived cache of raw payloads received from Discord, keyed by route and user. It is ``None`` when
+        ``DISCORD_RESPONSE_CACHE_TTL`` is set to ``0`` in app config.
 
     """
 
@@ -29,4 +29,22 @@ DISCORD_DEFAULT_USER_AVATAR_BASE_URL = DISCORD_EMBED_BASE_BASE_URL + "embed/avat
 DISCORD_GUILD_ICON_BASE_URL = DISCORD_IMAGE_BASE_URL + "icons/{guild_id}/{icon_hash}.png"
 DISCORD_GUILD_MEMBER_AVATAR_BASE_URL = DISCORD_IMAGE_BASE_URL + "guilds/{guild_id}/users/{user_id}/avatars/{avatar_hash}.{format}"
 
+
+def _compile_url_template(template, *fields):
+    """Compiles an URL template into a function which renders it as an f-string with positional fields."""
+    return eval(f"lambda {', '.join(fields)}: f{template!r}")
+
+
+_USER_AVATAR_URL = _compile_url_template(DISCORD_USER_AVATAR_BASE_URL, "user_id", "avatar_hash", "format")
+_DEFAULT_USER_AVATAR_URL = _compile_url_template(DISCORD_DEFAULT_USER_AVATAR_BASE_URL, "modulo5")
+_GUILD_ICON_URL = _compile_url_template(DISCORD_GUILD_ICON_BASE_URL, "guild_id", "icon_hash")
+_GUILD_MEMBER_AVATAR_URL = _compile_url_template(
+    DISCORD_GUILD_MEMBER_AVATAR_BASE_URL, "guild_id", "user_id", "avatar_hash", "format")
+
+
 DISCORD_USERS_CACHE_DEFAULT_MAX_LIMIT = 100
+
+DISCORD_MAX_CONCURRENT_REQUESTS = 10
+
+DISCORD_RESPONSE_CACHE_DEFAULT_MAX_SIZE = 4096
+DISCORD_RESPONSE_CACHE_DEFAULT_TTL = 30
@@ -1,27 +1,43 @@
+from .. import configs
+
 from flask import current_app
-from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 
-class DiscordModelsMeta(ABCMeta):
+class DiscordModelsBase(object):
 
     ROUTE = str()
-
-    def __init__(cls, name, *args, **kwargs):
-        if not cls.ROUTE and name != "DiscordModelsBase":
-            raise NotImplementedError(f"ROUTE must be specified in a Discord model: {name}.")
-        super().__init__(name, *args, **kwargs)
-
-
-class DiscordModelsBase(metaclass=DiscordModelsMeta):
-
     BOT = False
     MANY = False
 
-    @abstractmethod
+    # Mapping of attribute name to a callable which resolves its value from the raw payload. These attributes
+    # are only read from the payload on first access and are then stored on the instance.
+    _LAZY_ATTRIBUTES = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.ROUTE:
+            raise NotImplementedError(f"ROUTE must be specified in a Discord model: {cls.__name__}.")
+        # Route split around the guild ID placeholder, so it doesn't have to be searched for on every request.
+        cls._ROUTE_PARTS = tuple(cls.ROUTE.split("{guild_id}", 1)) if "{guild_id}" in cls.ROUTE else None
+
     def __init__(self, payload, guild_id=None):
         self._payload = payload
         self._guild_id = guild_id
 
+    def __getattr__(self, name):
+        try:
+            resolve = self._LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}") from None
+        try:
+            value = self.__dict__[name] = resolve(self._payload)
+        except KeyError as e:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}, missing {e} in payload"
+            ) from e
+        return value
+
     @staticmethod
     def _request(*args, **kwargs):
         """A shorthand to :py:func:flask_discord.request`. It uses Flask current_app local proxy to get the
@@ -35,10 +51,91 @@ class DiscordModelsBase(metaclass=DiscordModelsMeta):
         """A shorthand to :py:func:flask_discord.bot_request`."""
         return current_app.discord.bot_request(*args, **kwargs)
 
+    @staticmethod
+    def _access_token():
+        token = current_app.discord.get_authorization_token() or dict()
+        return token.get("access_token")
+
+    @staticmethod
+    def _get_cached_response(key):
+        client = current_app.discord
+        cache = client.response_cache
+        if cache is None:
+            return
+        with client.response_cache_lock:
+            return cache.get(key)
+
+    @staticmethod
+    def _cache_response(key, payload):
+        client = current_app.discord
+        cache = client.response_cache
+        if cache is None:
+            return
+        with client.response_cache_lock:
+            cache[key] = payload
+
+    @classmethod
+    def _invalidate_cached_responses(cls):
+        """Drops all of the cached responses which were received using access token of the current user."""
+        client = current_app.discord
+        cache = client.response_cache
+        if cache is None:
+            return
+        access_token = cls._access_token()
+        with client.response_cache_lock:
+            for key in [key for key in cache if key[2] == access_token]:
+                cache.pop(key, None)
+
+    @classmethod
+    def _route(cls, guild_id=0):
+        if guild_id != 0 and cls._ROUTE_PARTS is not None:
+            prefix, suffix = cls._ROUTE_PARTS
+            return f"{prefix}{guild_id}{suffix}"
+        return cls.ROUTE
+
+    @classmethod
+    def _cache_key(cls, route):
+        return route, cls.BOT, None if cls.BOT else cls._access_token()
+
+    @classmethod
+    def _fetch_from_api_concurrently(cls, guild_ids):
+        """Returns list of instances of this model for each of the given guild IDs in the same order. Payloads which
+        aren't cached are requested concurrently with at most ``flask_discord.configs.DISCORD_MAX_CONCURRENT_REQUESTS``
+        requests in flight. Worker threads only send the HTTP requests and don't touch any Flask context, everything
+        else happens on the calling thread.
+
+        """
+        client = current_app.discord
+        if cls.BOT:
+            send = client.bot_request
+        else:
+            # Refresh the token once here, so that the workers never try to refresh the same token concurrently.
+            client._refresh_token_if_expiring()
+            token = client.get_authorization_token()
+
+            def send(route):
+                return client.request(route, token=token)
+
+        routes = [cls._route(guild_id) for guild_id in guild_ids]
+        keys = [cls._cache_key(route) for route in routes]
+        payloads = [cls._get_cached_response(key) for key in keys]
+        missing = [index for index, payload in enumerate(payloads) if payload is None]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=configs.DISCORD_MAX_CONCURRENT_REQUESTS) as executor:
+                for index, payload in zip(missing, executor.map(send, [routes[index] for index in missing])):
+                    payloads[index] = payload
+
+        instances = [cls(payload, guild_id) for payload, guild_id in zip(payloads, guild_ids)]
+        for index in missing:
+            cls._cache_response(keys[index], payloads[index])
+        return instances
+
     @classmethod
     def fetch_from_api(cls, guild_id=0):
         """A class method which returns an instance or list of instances of this model by implicitly making an
-        API call to Discord.
+        API call to Discord. Received payloads are cached for ``DISCORD_RESPONSE_CACHE_TTL`` seconds per route and
+        user, so repeated calls within that time don't hit Discord again.
 
         Returns
         -------
@@ -48,23 +145,32 @@ class DiscordModelsBase(metaclass=DiscordModelsMeta):
             List of instances of this model when many of these models exist.
 
         """
-        route = cls.ROUTE
-
-        if guild_id != 0:
-            route = cls.ROUTE.replace("{guild_id}", str(guild_id))
+        route = cls._route(guild_id)
+        key = cls._cache_key(route)
+        payload = cls._get_cached_response(key)
+        cached = payload is not None
 
-        request_method = cls._bot_request if cls.BOT else cls._request
-        payload = request_method(route)
+        if not cached:
+            request_method = cls._bot_request if cls.BOT else cls._request
+            payload = request_method(route)
 
         if guild_id == 0:
             if cls.MANY:
-                return [cls(_) for _ in payload]
-            return cls(payload)
+                instance = [cls(_) for _ in payload]
+            else:
+                instance = cls(payload)
         else:
-            return cls(payload, guild_id)
+            instance = cls(payload, guild_id)
+
+        # Only cache on a miss, writing again would push back the expiry of the cached payload.
+        if not cached:
+            cls._cache_response(key, payload)
+        return instance
 
     def to_json(self):
-        """A utility method which returns raw payload object as it was received from discord.
+        """A utility method which returns raw payload object as it was received from discord. The payload is
+        returned as it is without copying or rebuilding it and is shared with the internal responses cache,
+        so it must not be modified.
 
         Returns
         -------
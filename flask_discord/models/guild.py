@@ -5,6 +5,9 @@ from .. import types
 from .. import configs
 
 
+_GUILD_ICON_URL = configs._GUILD_ICON_URL
+
+
 class Guild(DiscordModelsBase):
     """Class representing discord Guild the user is part of.
 
@@ -16,6 +19,8 @@ class Guild(DiscordModelsBase):
         Checks if two guild's are not the same.
     str(x)
         Returns the guild's name.
+    hash(x)
+        Returns the hash of the guild's ID.
 
     Attributes
     ----------
@@ -35,16 +40,20 @@ class Guild(DiscordModelsBase):
     MANY = True
     ROUTE = "/users/@me/guilds"
 
+    _LAZY_ATTRIBUTES = {
+        "icon_hash": lambda p: p.get("icon"),
+        "is_owner": lambda p: p.get("owner"),
+        "permissions": lambda p: Guild.__get_permissions(p.get("permissions")),
+        "approximate_member_count": lambda p: p.get("approximate_member_count"),
+        "approximate_presence_count": lambda p: p.get("approximate_presence_count"),
+        "features": lambda p: p.get("features"),
+    }
+
     def __init__(self, payload):
         super().__init__(payload)
-        self.id = int(self._payload["id"])
-        self.name = self._payload["name"]
-        self.icon_hash = self._payload.get("icon")
-        self.is_owner = self._payload.get("owner")
-        self.permissions = self.__get_permissions(self._payload.get("permissions"))
-        self.approximate_member_count = self._payload.get("approximate_member_count")
-        self.approximate_presence_count = self._payload.get("approximate_presence_count")
-        self.features = self._payload.get("features")
+        # Only the attributes used for identity are read eagerly, rest are resolved lazily.
+        self.id = int(payload["id"])
+        self.name = payload["name"]
 
     @staticmethod
     def __get_permissions(permissions_value):
@@ -56,17 +65,17 @@ class Guild(DiscordModelsBase):
         return self.name
 
     def __eq__(self, guild):
-        return isinstance(guild, Guild) and guild.id == self.id
+        return guild.__class__ is self.__class__ and guild.id == self.id
 
-    def __ne__(self, guild):
-        return not self.__eq__(guild)
+    def __hash__(self):
+        return hash(self.id)
 
     @property
     def icon_url(self):
         """A property returning direct URL to the guild's icon. Returns None if guild has no icon set."""
         if not self.icon_hash:
             return
-        return configs.DISCORD_GUILD_ICON_BASE_URL.format(guild_id=self.id, icon_hash=self.icon_hash)
+        return _GUILD_ICON_URL(self.id, self.icon_hash)
 
     @classmethod
     def fetch_from_api(cls, cache=True):
@@ -38,22 +38,28 @@ class Integration(object):
 
     """
 
-    def __init__(self, payload):
-        self._payload = payload
-        self.id = int(self._payload.get("id", 0))
-        self.name = self._payload.get("name")
-        self.type = self._payload.get("type")
-        self.enabled = self._payload.get("enabled")
-        self.syncing = self._payload.get("syncing")
-        self.role_id = int(self._payload.get("role_id", 0))
-        self.expire_behaviour = self._payload.get("expire_behaviour")
-        self.expire_grace_period = self._payload.get("expire_grace_period")
-        # self.user = User(self._payload.get("user", dict()))
-        self.account = self._payload.get("account")
-        self.synced_at = self._payload.get("synced_at")
-        self.enable_emoticons = self._payload.get("enable_emoticons", False)
-        self.subscriber_count = self._payload.get("subscriber_count", None)
-        self.revoked = self._payload.get("revoked", False)
-        self.application = self._payload.get("application")
-        self.scopes = self._payload.get("scopes")
+    __slots__ = (
+        "_payload", "id", "name", "type", "enabled", "syncing", "role_id", "expire_behaviour",
+        "expire_grace_period", "account", "synced_at", "enable_emoticons", "subscriber_count",
+        "revoked", "application", "scopes",
+    )
 
+    def __init__(self, payload):
+        self._payload = p = payload
+        get = p.get
+        self.id = int(p["id"]) if "id" in p else 0
+        self.name = p["name"]
+        self.type = p["type"]
+        self.enabled = get("enabled")
+        self.syncing = get("syncing")
+        self.role_id = int(p["role_id"]) if "role_id" in p else 0
+        self.expire_behaviour = get("expire_behaviour")
+        self.expire_grace_period = get("expire_grace_period")
+        # self.user = User(get("user", dict()))
+        self.account = get("account")
+        self.synced_at = get("synced_at")
+        self.enable_emoticons = get("enable_emoticons", False)
+        self.subscriber_count = get("subscriber_count", None)
+        self.revoked = get("revoked", False)
+        self.application = get("application")
+        self.scopes = get("scopes")
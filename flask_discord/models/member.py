@@ -1,10 +1,16 @@
 from .base import DiscordModelsBase
 from flask import current_app
+from functools import cached_property
 
 from .. import types
 from .. import configs
 
 
+_IMAGE_FORMAT = configs.DISCORD_IMAGE_FORMAT
+_ANIMATED_IMAGE_FORMAT = configs.DISCORD_ANIMATED_IMAGE_FORMAT
+_GUILD_MEMBER_AVATAR_URL = configs._GUILD_MEMBER_AVATAR_URL
+
+
 class GuildMember(DiscordModelsBase):
     """Class representing discord Guild member objuect of the user.
 
@@ -16,6 +22,8 @@ class GuildMember(DiscordModelsBase):
         Checks if two guild members's are not the same.
     str(x)
         Returns the guild members's name.
+    hash(x)
+        Returns the hash of the guild member's ID.
 
     Attributes
     ----------
@@ -50,22 +58,26 @@ class GuildMember(DiscordModelsBase):
     MANY = False
     ROUTE = "/users/@me/guilds/{guild_id}/member"
 
+    _LAZY_ATTRIBUTES = {
+        "nick": lambda p: p.get("nick", None),
+        "avatar_hash": lambda p: p.get("avatar", None),
+        "roles": lambda p: p["roles"],
+        "joined_at": lambda p: p.get("joined_at", None),
+        "premium_since": lambda p: p.get("premium_since", None),
+        "deaf": lambda p: p.get("deaf"),
+        "mute": lambda p: p.get("mute"),
+        "flags": lambda p: p.get("flags"),
+        "pending": lambda p: p.get("pending", False),
+        "permissions": lambda p: p.get("permissions", 0),
+        "communication_disabled_until": lambda p: p.get("communication_disabled_until", None),
+        "id": lambda p: int(p["user"]["id"]),
+    }
+
     def __init__(self, payload, guild_id):
         super().__init__(payload, guild_id=guild_id)
-        self.user = self._payload.get("user")
-        self.nick = self._payload.get("nick", None)
-        self.avatar_hash = self._payload.get("avatar", None)
-        self.roles = self._payload.get("roles")
-        self.joined_at = self._payload.get("joined_at", None)
-        self.premium_since = self._payload.get("premium_since", None)
-        self.deaf = self._payload.get("deaf")
-        self.mute = self._payload.get("mute")
-        self.flags = self._payload.get("flags")
-        self.pending = self._payload.get("pending", False)
-        self.permissions = self._payload.get("permissions", 0)
-        self.communication_disabled_until = self._payload.get("communication_disabled_until", None)
+        # Only the attributes used for caching are read eagerly, rest are resolved lazily.
+        self.user = payload["user"]
         self.guild_id = guild_id
-        self.id = int(self.user.get("id"))
 
     @staticmethod
     def __get_permissions(permissions_value):
@@ -77,28 +89,25 @@ class GuildMember(DiscordModelsBase):
         return self.nick or self.user.get("global_name") or self.user.get("username")
 
     def __eq__(self, member):
-        return isinstance(member, GuildMember) and member.id == self.id
+        return member.__class__ is self.__class__ and member.id == self.id
 
-    def __ne__(self, member):
-        return not self.__eq__(member)
+    def __hash__(self):
+        return hash(self.id)
 
-    @property
+    @cached_property
     def icon_url(self):
         """A property returning direct URL to the members's guild avatar. Returns None if member has no avatar set."""
-        if not self.avatar_hash:
+        avatar_hash = self.avatar_hash
+        if not avatar_hash:
             return
-        image_format = configs.DISCORD_ANIMATED_IMAGE_FORMAT \
-            if self.is_avatar_animated else configs.DISCORD_IMAGE_FORMAT
-        return configs.DISCORD_GUILD_MEMBER_AVATAR_BASE_URL.format(
-            guild_id=self._guild_id, user_id=self.id, avatar_hash=self.avatar_hash, format=image_format)
+        image_format = _ANIMATED_IMAGE_FORMAT if self.is_avatar_animated else _IMAGE_FORMAT
+        return _GUILD_MEMBER_AVATAR_URL(self._guild_id, self.id, avatar_hash, image_format)
 
-    @property
+    @cached_property
     def is_avatar_animated(self):
         """A boolean representing if avatar of user is animated. Meaning user has GIF avatar."""
-        try:
-            return self.avatar_hash.startswith("a_")
-        except AttributeError:
-            return False
+        avatar_hash = self.avatar_hash
+        return avatar_hash is not None and avatar_hash[:2] == "a_"
 
     @classmethod
     def fetch_from_api(cls, guild_id=0, cache=True):
@@ -1,13 +1,22 @@
+import typing
+
 from .. import configs
 
-from .guild import Guild
-from .member import GuildMember
 from .. import exceptions
 from .base import DiscordModelsBase
-from .connections import UserConnection
 
+from functools import cached_property
 from flask import current_app, session
 
+if typing.TYPE_CHECKING:
+    from .member import GuildMember
+
+
+_IMAGE_FORMAT = configs.DISCORD_IMAGE_FORMAT
+_ANIMATED_IMAGE_FORMAT = configs.DISCORD_ANIMATED_IMAGE_FORMAT
+_USER_AVATAR_URL = configs._USER_AVATAR_URL
+_DEFAULT_USER_AVATAR_URL = configs._DEFAULT_USER_AVATAR_URL
+
 
 class User(DiscordModelsBase):
     """Class representing Discord User.
@@ -21,6 +30,8 @@ class User(DiscordModelsBase):
         Checks if two user's are not the same.
     str(x)
         Returns the user's name with discriminator.
+    hash(x)
+        Returns the hash of the user's ID.
 
     Attributes
     ----------
@@ -59,26 +70,29 @@ class User(DiscordModelsBase):
 
     ROUTE = "/users/@me"
 
+    _LAZY_ATTRIBUTES = {
+        "discriminator": lambda p: p["discriminator"],
+        "avatar_hash": lambda p: p.get("avatar", p["discriminator"]),
+        "bot": lambda p: p.get("bot", False),
+        "mfa_enabled": lambda p: p.get("mfa_enabled"),
+        "locale": lambda p: p.get("locale"),
+        "verified": lambda p: p.get("verified"),
+        "email": lambda p: p.get("email"),
+        "flags": lambda p: p.get("flags"),
+        "premium_type": lambda p: p.get("premium_type"),
+        "is_migrated": lambda p: p["discriminator"] == "0",
+        "global_name": lambda p: (p.get("global_name", None) or p["username"]) if p["discriminator"] == "0" else None,
+    }
+
     def __init__(self, payload):
         super().__init__(payload)
-        self.id = int(self._payload["id"])
-        self.username = self._payload["username"]
-        self.discriminator = self._payload["discriminator"]
-        self.avatar_hash = self._payload.get("avatar", self.discriminator)
-        self.bot = self._payload.get("bot", False)
-        self.mfa_enabled = self._payload.get("mfa_enabled")
-        self.locale = self._payload.get("locale")
-        self.verified = self._payload.get("verified")
-        self.email = self._payload.get("email")
-        self.flags = self._payload.get("flags")
-        self.premium_type = self._payload.get("premium_type")
-        self.is_migrated = self._payload.get("discriminator") == "0"
-        self.global_name = (self._payload.get("global_name", None)
-                            or self._payload.get("username")) if self.is_migrated else None
+        # Only the attributes used for identity and caching are read eagerly, rest are resolved lazily.
+        self.id = int(payload["id"])
+        self.username = payload["username"]
 
         # Few properties which are intended to be cached.
         self._guilds = None         # Mapping of guild ID to flask_discord.models.Guild(...).
-        self._guild_members: dict[int, GuildMember] = dict()  # Mapping of guild ID to flask_discord.models.GuildMember(...).
+        self._guild_members: dict[int, "GuildMember"] = dict()  # Mapping of guild ID to flask_discord.models.GuildMember(...).
         self.connections = None     # List of flask_discord.models.UserConnection(...).
 
     @property
@@ -117,38 +131,35 @@ class User(DiscordModelsBase):
             return f"{self.name}#{self.discriminator}"
 
     def __eq__(self, user):
-        return isinstance(user, User) and user.id == self.id
+        return user.__class__ is self.__class__ and user.id == self.id
 
-    def __ne__(self, user):
-        return not self.__eq__(user)
+    def __hash__(self):
+        return hash(self.id)
 
     @property
     def name(self):
         """An alias to the username attribute."""
         return self.username
 
-    @property
+    @cached_property
     def avatar_url(self):
         """A property returning direct URL to user's avatar."""
-        if not self.avatar_hash:
+        avatar_hash = self.avatar_hash
+        if not avatar_hash:
             return self.default_avatar_url
-        image_format = configs.DISCORD_ANIMATED_IMAGE_FORMAT \
-            if self.is_avatar_animated else configs.DISCORD_IMAGE_FORMAT
-        return configs.DISCORD_USER_AVATAR_BASE_URL.format(
-            user_id=self.id, avatar_hash=self.avatar_hash, format=image_format)
+        image_format = _ANIMATED_IMAGE_FORMAT if self.is_avatar_animated else _IMAGE_FORMAT
+        return _USER_AVATAR_URL(self.id, avatar_hash, image_format)
 
-    @property
+    @cached_property
     def default_avatar_url(self):
         """A property which returns the default avatar URL as when user doesn't has any avatar set."""
-        return configs.DISCORD_DEFAULT_USER_AVATAR_BASE_URL.format((self.id >> 22) % 6)
+        return _DEFAULT_USER_AVATAR_URL((self.id >> 22) % 6)
 
-    @property
+    @cached_property
     def is_avatar_animated(self):
         """A boolean representing if avatar of user is animated. Meaning user has GIF avatar."""
-        try:
-            return self.avatar_hash.startswith("a_")
-        except AttributeError:
-            return False
+        avatar_hash = self.avatar_hash
+        return avatar_hash is not None and avatar_hash[:2] == "a_"
 
     @classmethod
     def fetch_from_api(cls, guilds=False, connections=False, members=False):
@@ -182,8 +193,7 @@ class User(DiscordModelsBase):
         if connections:
             self.fetch_connections()
         if guilds and members:
-            for guild in self.guilds:
-                self.fetch_guild_members(guild.id)
+            self.fetch_guild_members()
 
         return self
 
@@ -226,11 +236,14 @@ class User(DiscordModelsBase):
                    "roles": roles}
         except KeyError:
             raise exceptions.Unauthorized
-        return self._bot_request(f"/guilds/{guild_id}/members/{self.id}", method="PUT", json=data) or dict()
+        member = self._bot_request(f"/guilds/{guild_id}/members/{self._payload['id']}", method="PUT", json=data)
+        self._invalidate_cached_responses()
+        return member or dict()
 
     def fetch_guilds(self) -> list:
-        """A method which makes an API call to Discord to get user's guilds. It prepares the internal guilds cache
-        and returns list of all guilds the user is member of.
+        """A method which makes an API call to Discord to get user's guilds, unless a response received within
+        ``DISCORD_RESPONSE_CACHE_TTL`` seconds is cached. It prepares the internal guilds cache and returns list of
+        all guilds the user is member of.
 
         Returns
         -------
@@ -238,12 +251,15 @@ class User(DiscordModelsBase):
             List of :py:class:`flask_discord.Guilds` instances.
 
         """
+        from .guild import Guild
+
         self._guilds = {guild.id: guild for guild in Guild.fetch_from_api(cache=False)}
         return self.guilds
 
     def fetch_connections(self) -> list:
-        """A method which makes an API call to Discord to get user's connections. It prepares the internal connection
-        cache and returns list of all connection instances.
+        """A method which makes an API call to Discord to get user's connections, unless a response received within
+        ``DISCORD_RESPONSE_CACHE_TTL`` seconds is cached. It prepares the internal connection cache and returns list
+        of all connection instances.
 
         Returns
         -------
@@ -251,12 +267,15 @@ class User(DiscordModelsBase):
             A list of :py:class:`flask_discord.UserConnection` instances.
 
         """
+        from .connections import UserConnection
+
         self.connections = UserConnection.fetch_from_api(cache=False)
         return self.connections
 
-    def fetch_guild_member(self, guild_id) -> GuildMember:
-        """A method which makes an API call to Discord to get user's guild member.
-        It returns the guild member object for the guild the user is member of.
+    def fetch_guild_member(self, guild_id) -> "GuildMember":
+        """A method which makes an API call to Discord to get user's guild member, unless a response received within
+        ``DISCORD_RESPONSE_CACHE_TTL`` seconds is cached. It returns the guild member object for the guild the user
+        is member of.
 
         Parameters
         ----------
@@ -269,11 +288,36 @@ class User(DiscordModelsBase):
             An instance of :py:class:`flask_discord.GuildMember` for given guild_id.
 
         """
+        from .member import GuildMember
+
         member = GuildMember.fetch_from_api(guild_id, cache=False)
         self.guild_members = member
         return member
 
+    def fetch_guild_members(self) -> dict:
+        """A method which makes API calls to Discord to get user's guild member objects for all of the guilds
+        the user is member of. Requests are sent concurrently with at most
+        ``flask_discord.configs.DISCORD_MAX_CONCURRENT_REQUESTS`` in flight at once. It prepares the internal guild
+        members cache and returns it. User's guilds are fetched first if they aren't cached yet.
+
+        Returns
+        -------
+        dict
+            A mapping of guild ID to :py:class:`flask_discord.GuildMember` instances.
+
+        """
+        from .member import GuildMember
+
+        guilds = self.guilds if self._guilds is not None else self.fetch_guilds()
+        members = GuildMember._fetch_from_api_concurrently([guild.id for guild in guilds])
+
+        for member in members:
+            self.guild_members = member
+        return self.guild_members
+
 
 class Bot(User):
     """Class representing the client user itself."""
     # TODO: What is this?
+
+    _LAZY_ATTRIBUTES = dict(User._LAZY_ATTRIBUTES, bot=lambda p: p.get("bot", True))
@@ -34,6 +34,9 @@ if on_rtd:
 extra_requirements = {
     'docs': [
         'sphinx==1.8.3'
+    ],
+    'fast_json': [
+        'orjson'
     ]
 }
 